@@ -1,9 +1,13 @@
+import os
 import pickle
+import shutil
+import tempfile
 from abc import ABCMeta, abstractmethod
 from colorama import Fore, Style
 
+import joblib
 import numpy as np
-from sklearn.model_selection import RepeatedKFold
+from sklearn.model_selection import RepeatedKFold, train_test_split
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.base import BaseEstimator, clone
 
@@ -186,6 +190,22 @@ class SearchBase(BaseEstimator, metaclass=ABCMeta):
 
         param_grid = self._grid(self.grid_mode, x.shape)
 
+        # Share the training data with the workers through a memmap, so
+        # every trial dispatch maps pages instead of re-pickling the arrays
+        mmap_dir = None
+        if (self.n_jobs != 1) & isinstance(x, np.ndarray):
+            mmap_dir = tempfile.mkdtemp(prefix='autopt_')
+            x = self._mmap(np.ascontiguousarray(x), mmap_dir, 'x')
+            if isinstance(y, np.ndarray):
+                y = self._mmap(np.ascontiguousarray(y), mmap_dir, 'y')
+
+        try:
+            self._fit(x, y, param_grid, **fit_params)
+        finally:
+            if mmap_dir:
+                shutil.rmtree(mmap_dir, ignore_errors=True)
+
+    def _fit(self, x, y, param_grid, **fit_params):
         lookup = self._param_search(self._estimator, param_grid, cv=self.cv, n_iter=self.n_iter,
                                     scoring=self.scoring, refit=self.refit, n_jobs=self.n_jobs,
                                     pre_dispatch=self.pre_dispatch, verbose=self.search_verbosity,
@@ -199,7 +219,6 @@ class SearchBase(BaseEstimator, metaclass=ABCMeta):
             # Set all lookup params to the searcher
             self.__setattr__(attr, lookup.__getattribute__(attr))
 
-        self.base_estimator_ = clone(self._estimator)
         self.cv_ = self.cv
 
         try:
@@ -218,14 +237,29 @@ class SearchBase(BaseEstimator, metaclass=ABCMeta):
                 else:
                     method = 'isotonic'
 
-                cc = CalibratedClassifierCV(base_estimator=clone(self._estimator), cv=self.cv,
-                                            n_jobs=self.n_jobs, method=method)
-                cc.fit(x, y)
+                # One refit on a train split plus a prefit calibration on the
+                # holdout, instead of cv redundant refits of the base model
+                x_fit, x_cal, y_fit, y_cal = train_test_split(
+                    x, y, test_size=0.2, stratify=y,
+                    random_state=np.random.randint(0, 1e+5))
+
+                estimator = clone(self._estimator).set_params(**self.best_params_)
+                estimator.fit(x_fit, y_fit)
+
+                cc = CalibratedClassifierCV(base_estimator=estimator,
+                                            cv='prefit', method=method)
+                cc.fit(x_cal, y_cal)
                 self.cc_ = cc
             except Exception as e:
                 print(Fore.RED + '[Warning] Process failed. Could not get the calibrated classifier')
                 print(Fore.RED + f'[Error] {e}')
 
+    @staticmethod
+    def _mmap(arr, folder, name):
+        path = os.path.join(folder, f'{name}.mmap')
+        joblib.dump(arr, path)
+        return joblib.load(path, mmap_mode='r')
+
     def save(self, path_to_file=None, package=True):
         """
         Save the results to the file specified
@@ -251,7 +285,9 @@ class SearchBase(BaseEstimator, metaclass=ABCMeta):
                 raise ValueError('File path is not specified')
 
         with open(path_to_file, 'wb') as f:
-            pickle.dump(results if results else self, f)
+            # Protocol 5 (PEP 574) streams ndarray buffers as contiguous
+            # frames instead of pushing them through pickle's byte framing
+            pickle.dump(results if results else self, f, protocol=5)
 
     def top_estimators(self, get_top=None, top_method=None,
                        candidate_span=None):
@@ -267,19 +303,23 @@ class SearchBase(BaseEstimator, metaclass=ABCMeta):
                                   top_method, candidate_span=candidate_span,
                                   n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
 
+    @property
+    def base_estimator_(self):
+        # Rebuilt on access: storing the clone only bloated the instance
+        # and every pickled results package
+        return clone(self._estimator).set_params(**self.best_params_)
+
+    _RESULT_ATTRS = ('cv_results_',
+                     'best_params_',
+                     'best_score_',
+                     'base_estimator_',
+                     'best_estimator_',
+                     'top_estimators_',
+                     'cc_', 'cv_')
+
     def _results_package(self):
-        attrs = ['cv_results_',
-                 'best_params_',
-                 'best_score_',
-                 'base_estimator_',
-                 'best_estimator_',
-                 'top_estimators_',
-                 'cc_', 'cv_']
-
-        present_attrs = set(attrs) & set(self.__dict__)
-        results = {attr: getattr(self, attr) for attr in present_attrs}
-
-        return results
+        return {attr: value for attr in self._RESULT_ATTRS
+                if (value := getattr(self, attr, None)) is not None}
 
     @staticmethod
     @abstractmethod
@@ -19,6 +19,16 @@ METHODS = {'kmeans_exact': partial(clustering, model=KMeans, how='exact'),
            'seq_furthest': partial(sequential, init='furthest')}
 
 
+def _top_k_indices(scores, k):
+    """Indices of the k best scores in ascending score order,
+       without a full sort of the candidate pool"""
+    scores = np.ravel(scores)
+    if k >= len(scores):
+        return scores.argsort()
+    top = np.argpartition(scores, -k)[-k:]
+    return top[scores[top].argsort()]
+
+
 def _get_top_method(top_method, n_jobs=1, pre_dispatch='2*n_jobs'):
     if callable(top_method):
         return top_method
@@ -100,10 +110,14 @@ def get_top_estimators(get_top, results_package, top_method=None,
         raise ValueError('The number of top estimators can not be higher than '
                          'the total number of estimators')
 
-    set_to_base = np.vectorize(lambda x: clone(base_estimator_).set_params(**x))
+    def set_to_base(top_params):
+        estimators = np.empty(len(top_params), dtype=object)
+        for i, candidate_params in enumerate(top_params):
+            estimators[i] = clone(base_estimator_).set_params(**candidate_params)
+        return estimators
 
     if not top_method:
-        top_indices = scores.flatten().argsort()[-get_top:]
+        top_indices = _top_k_indices(scores, get_top)
         top_params = params[top_indices]
         top_estimators = set_to_base(top_params)
 
@@ -121,7 +135,7 @@ def get_top_estimators(get_top, results_package, top_method=None,
         candidate_span = 5 * get_top
     n_candidates = min(n_evaluations, candidate_span)
 
-    indices = scores.flatten().argsort()[-n_candidates:].astype(int)
+    indices = _top_k_indices(scores, n_candidates).astype(int)
     candidate_preds = predictions[:, indices]
     candidate_scores = scores[indices]
     candidate_params = params[indices]
@@ -1,18 +1,39 @@
 from ..utils import disable
 
 from collections.abc import Mapping, Iterable
+from contextlib import nullcontext
 from functools import partial
-from joblib import logger
+from joblib import Parallel, logger, parallel_backend
+from logging import Logger, StreamHandler
+from logging.handlers import MemoryHandler
 from timeit import default_timer as timer
 import pickle
+import sys
 
 import numpy as np
 from scipy.stats import rankdata
 from sklearn.metrics import get_scorer, check_scoring
+from sklearn.utils.fixes import delayed
 
 from .validation import cross_validate
 from GPyOpt.methods import BayesianOptimization
-from sklearn.base import BaseEstimator, clone
+from GPyOpt.core.task.space import Design_space
+from GPyOpt.experiment_design import initial_design
+from sklearn.base import BaseEstimator, is_classifier, clone
+from sklearn.model_selection._split import check_cv
+
+
+def _mean_std(values):
+    """One-pass mean and standard deviation for a small 1D array"""
+    n = len(values)
+    s = sq = 0.0
+    for v in values:
+        v = float(v)
+        s += v
+        sq += v * v
+    m = s / n
+    var = sq / n - m * m
+    return m, var ** 0.5 if var > 0 else 0.0
 
 
 class BayesianSearchCV(BayesianOptimization, BaseEstimator):
@@ -124,6 +145,8 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
             self.best_score_ = None
             self.best_params_ = None
             self.best_index_ = None
+            self._best_score = -np.inf
+            self._best_idx = -1
             self.scorer_ = None
             self.multimetric_ = None
 
@@ -131,104 +154,136 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
             if not isinstance(cv, int):
                 n_splits_ = cv.get_n_splits()
             self.n_splits_ = n_splits_
-
-            self.mean_fit_time = np.zeros(s)
-            self.std_fit_time = np.zeros(s)
-            self.mean_score_time = np.zeros(s)
-            self.std_score_time = np.zeros(s)
-            self.params = np.zeros(s, dtype=object)
-            self.test_scores = np.zeros((n_splits_, s))
-            self.mean_test_score = np.zeros(s)
-            self.std_test_score = np.zeros(s)
+            self._progress_msg = f"{n_splits_}/{n_splits_}"
+
+            self._init_logger()
+
+            # Scalar series live in plain lists (amortized O(1) appends);
+            # only the per-split matrix stays a preallocated 2D buffer
+            self.mean_fit_time = []
+            self.std_fit_time = []
+            self.mean_score_time = []
+            self.std_score_time = []
+            self.params = []
+            # float32 is plenty for fold statistics and halves the copy,
+            # pickle and cache traffic of the bookkeeping buffers
+            self.test_scores = np.empty((n_splits_, s), dtype=np.float32)
+            self.mean_test_score = []
+            self.std_test_score = []
             self.predictions = None
 
+        def _init_logger(self):
+            # Buffered progress output: lines reach stdout in batches
+            # instead of one flushed write per trial
+            self._log_handler = MemoryHandler(capacity=64,
+                                              target=StreamHandler(sys.stdout))
+            self._logger = Logger('autopt.hypersearch.bayesian')
+            self._logger.addHandler(self._log_handler)
+
+        def __getstate__(self):
+            # Handlers hold locks and streams, which cannot be pickled
+            # when the report travels to a joblib worker
+            state = self.__dict__.copy()
+            del state['_log_handler'], state['_logger']
+            return state
+
+        def __setstate__(self, state):
+            self.__dict__.update(state)
+            self._init_logger()
+
         def update(self, params, scores, exec_time):
             if self.return_predictions:
                 if self.predictions is None:
                     n_columns = scores['predictions'].shape[0]
-                    self.predictions = np.zeros((self.s, n_columns))
-
-            np.put(self.mean_fit_time, self.iter, np.mean(scores['fit_time']))
-            np.put(self.std_fit_time, self.iter, np.std(scores['fit_time']))
-            np.put(self.mean_score_time, self.iter, np.mean(scores['score_time']))
-            np.put(self.std_score_time, self.iter, np.std(scores['score_time']))
-            np.put(self.params, self.iter, params)
-            np.put(self.mean_test_score, self.iter, np.mean(scores['test_score']))
-            np.put(self.std_test_score, self.iter, np.std(scores['test_score']))
-            self.test_scores[:, self.iter] = scores['test_score']
+                    self.predictions = np.empty((self.s, n_columns),
+                                                dtype=np.float32)
+
+            # Plain scalar arithmetic: the arrays here hold one value per cv
+            # split, so NumPy's per-call dispatch costs more than the math
+            test_score = scores['test_score']
+
+            i = self.iter
+            m, std = _mean_std(scores['fit_time'])
+            self.mean_fit_time.append(m)
+            self.std_fit_time.append(std)
+            m, std = _mean_std(scores['score_time'])
+            self.mean_score_time.append(m)
+            self.std_score_time.append(std)
+            m, std = _mean_std(test_score)
+            self.params.append(params)
+            self.mean_test_score.append(m)
+            self.std_test_score.append(std)
+            self.test_scores[:, i] = test_score
+            if m > self._best_score:
+                self._best_score = m
+                self._best_idx = i
             if self.return_predictions:
-                self.predictions[self.iter, :] = scores['predictions']
+                self.predictions[i, :] = scores['predictions']
 
             self.iter += 1
             self.t += exec_time
             if self.iter == self.s - 1:
+                # Double the 2D buffers in place: one allocation plus a
+                # single copy of the filled part, no hstack of zeros
                 self.s = 2*self.s
-                new_shape = (self.s,)
-                self.mean_fit_time.resize(new_shape)
-                self.std_fit_time.resize(new_shape)
-                self.mean_score_time.resize(new_shape)
-                self.std_score_time.resize(new_shape)
-                self.params.resize(new_shape)
-                self.mean_test_score.resize(new_shape)
-                self.std_test_score.resize(new_shape)
-                self.test_scores = np.hstack((self.test_scores,
-                                              np.zeros(self.test_scores.shape)))
+                new = np.empty((self.n_splits_, self.s), dtype=np.float32)
+                new[:, :self.test_scores.shape[1]] = self.test_scores
+                self.test_scores = new
                 if self.return_predictions:
-                    self.predictions = np.vstack((self.predictions,
-                                                  np.zeros(self.predictions.shape)))
+                    new = np.empty((self.s, self.predictions.shape[1]),
+                                   dtype=np.float32)
+                    new[:self.predictions.shape[0], :] = self.predictions
+                    self.predictions = new
 
-            width = 80
+            if not self.verbose:
+                return
 
-            if self.verbose > 0:
-                progress_msg = f"{self.n_splits_}/{self.n_splits_}"
-                end_msg = f"[{self.iter}][CV {progress_msg}] END "
-                result_msg = ""
-
-                if self.verbose > 1:
-                    sorted_keys = sorted(params)
-                    params_msg = ", ".join(f"{k}={params[k]}" for k in sorted_keys)
-
-                    progress_msg = f"{self.n_splits_}/{self.n_splits_}"
-                    end_msg = f"[{self.iter}][CV {progress_msg}] END "
-                    result_msg = params_msg + (";" if params_msg else "")
-                    if self.verbose > 2:
-                        if isinstance(scores['test_score'], dict):
-                            for scorer_name in sorted(scores['test_score']):
-                                result_msg += f" {scorer_name}: ("
-                                result_msg += f"test={scores['test_score'][scorer_name].mean():.3f})"
-                        else:
-                            result_msg += ", score="
-                            result_msg += f"{scores['test_score'].mean():.3f}"
-                result_msg += f" total time={logger.short_format_time(self.t)}"
-
-                # Right align the result_msg
-                end_msg += "." * (width - len(end_msg) - len(result_msg))
-                end_msg += result_msg
-                print(end_msg)
+            width = 80
+            end_msg = f"[{self.iter}][CV {self._progress_msg}] END "
+            result_msg = ""
+
+            if self.verbose > 1:
+                params_msg = ", ".join(f"{k}={params[k]}" for k in sorted(params))
+                result_msg = params_msg + (";" if params_msg else "")
+                if self.verbose > 2:
+                    if isinstance(test_score, dict):
+                        for scorer_name in sorted(test_score):
+                            result_msg += f" {scorer_name}: ("
+                            result_msg += f"test={test_score[scorer_name].mean():.3f})"
+                    else:
+                        result_msg += f", score={m:.3f}"
+            result_msg += f" total time={logger.short_format_time(self.t)}"
+
+            # Right align the result_msg
+            self._logger.info(f"{end_msg}{result_msg:.>{width - len(end_msg)}}")
 
         def stage(self):
             width = 80
             if self.verbose > 0:
                 if self.iter == 0:
                     msg = f'{self.init_trials} INITIAL TRIALS'
-                    print(msg.center(width, '-'))
+                    self._logger.info(msg.center(width, '-'))
 
                 if self.iter == self.init_trials:
                     msg = 'BAYESIAN ACQUISITIONS'
-                    print(msg.center(width, '-'))
+                    self._logger.info(msg.center(width, '-'))
+
+        def flush(self):
+            self._log_handler.flush()
 
         def report(self):
+            self.flush()
             s = self.iter
-            cv_results = {'mean_fit_time': np.resize(self.mean_fit_time, s),
-                          'std_fit_time': np.resize(self.std_fit_time, s),
-                          'mean_score_time': np.resize(self.mean_score_time, s),
-                          'std_score_time': np.resize(self.std_score_time, s),
-                          'params': np.resize(self.params, s).tolist(),
-                          'mean_test_score': np.resize(self.mean_test_score, s),
-                          'std_test_score': np.resize(self.std_test_score, s)}
+            cv_results = {'mean_fit_time': np.fromiter(self.mean_fit_time, dtype=np.float32, count=s),
+                          'std_fit_time': np.fromiter(self.std_fit_time, dtype=np.float32, count=s),
+                          'mean_score_time': np.fromiter(self.mean_score_time, dtype=np.float32, count=s),
+                          'std_score_time': np.fromiter(self.std_score_time, dtype=np.float32, count=s),
+                          'params': list(self.params),
+                          'mean_test_score': np.fromiter(self.mean_test_score, dtype=np.float32, count=s),
+                          'std_test_score': np.fromiter(self.std_test_score, dtype=np.float32, count=s)}
 
             for cv in range(self.n_splits_):
-                cv_results['split{}_test_score'.format(cv)] = np.resize(self.test_scores[cv, :], s)
+                cv_results['split{}_test_score'.format(cv)] = self.test_scores[cv, :s].copy()
 
             if self.return_predictions:
                 cv_results['predictions'] = self.predictions[:s, :]
@@ -237,14 +292,10 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
                     rankdata(-cv_results['mean_test_score'], method="min"), dtype=np.int32
                 )
 
-            params, scores = np.resize(self.params, s), np.resize(self.mean_test_score, s)
-            best_idx = scores.argmax()
-            best_params = params[best_idx]
-            best_score = scores[best_idx]
-
-            self.best_score_ = best_score
-            self.best_params_ = best_params
-            self.best_index_ = best_idx
+            # Best candidate is tracked incrementally in update()
+            self.best_score_ = self._best_score
+            self.best_params_ = self.params[self._best_idx]
+            self.best_index_ = self._best_idx
             self.scorer_ = get_scorer(self.scoring)
             self.multimetric_ = True if isinstance(self.scorer_, Iterable) else False
 
@@ -270,6 +321,11 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
         self.n_iters_save = n_iters_save
         self.return_predictions = return_predictions
         self.kwargs = kwargs
+
+        # One parallelism budget: when GPyOpt batch-evaluates candidates
+        # (batch_size > 1) the outer layer owns the workers, and a nested
+        # pool inside cross_validate would only oversubscribe the CPUs
+        self._inner_n_jobs = 1 if kwargs.get('batch_size', 1) > 1 else n_jobs
         self._report = self._Report(cv=cv, verbose=verbose,
                                     init_trials=self.init_trials,
                                     return_predictions=return_predictions,
@@ -279,8 +335,17 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
         self._domain, self._str_params = self._check_bounds(param_grid,
                                                             n_samples=self._max_iter)
 
-        find_keys = np.vectorize(lambda k: k['name'])
-        self._keys = find_keys(self._domain)
+        # Structure-of-arrays view of the domain: parallel name/category
+        # sequences replace the per-bound dict lookups in the trial loop,
+        # and integer-valued columns are tagged once instead of type-checked
+        # per value
+        self._names = [b['name'] for b in self._domain]
+        self._cat_tables = [self._str_params.get(name) for name in self._names]
+        # Only discrete domains may be tagged: a continuous (lo, hi) bound
+        # with whole-number endpoints must not truncate its suggestions
+        self._int_flags = [b['type'] == 'discrete' and self._is_int_domain(b['domain'])
+                           for b in self._domain]
+        self._keys = np.array(self._names)
 
     def fit(self, x, y, **fit_params):
         """
@@ -296,12 +361,43 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
         y : array-like of shape (n_samples, n_output)
            Target relative to X for classification or regression
         """
-        estimator = clone(self.estimator)
-        loss = partial(self._f, estimator=estimator, x=x, y=y, **fit_params)
-        super().__init__(f=loss, domain=self._domain, maximize=True,
-                         initial_design_numdata=self.init_trials, **self.kwargs)
-        super().run_optimization(max_iter=self._max_iter, max_time=self.max_time,
-                                 eps=self.eps if self.eps else -1)
+        self._base_clone = clone(self.estimator)
+        loss = partial(self._f, estimator=self._base_clone, x=x, y=y, **fit_params)
+
+        # Materialize the cv splits once; cross_validate would otherwise
+        # recompute the identical split indices on every trial
+        cv = check_cv(self.cv, y, classifier=is_classifier(self._base_clone))
+        self._cached_splits = list(cv.split(x, y))
+
+        # The initial trials are mutually independent, so evaluate them in
+        # one joblib batch and hand GPyOpt ready (X, Y) pairs; only the
+        # acquisition loop that follows is inherently sequential
+        design_type = self.kwargs.get('initial_design_type', 'random')
+        space = Design_space(self._domain)
+        init_x = initial_design(design_type, space, self.init_trials)
+
+        # Keep one loky pool alive for the whole search instead of paying
+        # worker bring-up on every trial's cross_validate
+        pool = parallel_backend('loky', n_jobs=self.n_jobs) \
+            if self.n_jobs not in (None, 1) else nullcontext()
+
+        with pool:
+            self._report.stage()
+            init_results = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)(
+                delayed(self._evaluate)(point.reshape(1, -1), self._base_clone,
+                                        x, y, n_jobs=1, **fit_params)
+                for point in init_x)
+
+            init_y = np.empty((self.init_trials, 1))
+            for i, (feed_params, scores, exec_time) in enumerate(init_results):
+                self._report.update(feed_params, scores, exec_time)
+                # GPyOpt stores the minimized objective, hence the sign flip
+                init_y[i, 0] = -scores['test_score'].mean()
+
+            super().__init__(f=loss, domain=self._domain, maximize=True,
+                             X=init_x, Y=init_y, **self.kwargs)
+            super().run_optimization(max_iter=self._max_iter, max_time=self.max_time,
+                                     eps=self.eps if self.eps else -1)
 
         self._get_results(x, y, **fit_params)
 
@@ -320,7 +416,7 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
             raise ValueError('Path to file is not specified')
 
         with open(self.write_path, 'wb') as f:
-            pickle.dump(self._results, f)
+            pickle.dump(self._results, f, protocol=5)
 
     def _f(self, params, estimator, x, y, **fit_params):
         current_iter = self._report.iter - self.init_trials
@@ -329,24 +425,32 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
                 self._get_results(x, y, **fit_params)
                 self.save()
 
-        feed_params = self._get_feed_params(self._domain, params)
-        estimator = clone(estimator)
-        estimator.set_params(**feed_params)
-
         self._report.stage()
 
-        start = timer()
-        scores = cross_validate(estimator, x, y, scoring=self.scoring, cv=self.cv,
-                                fit_params=fit_params, return_predictions=self.return_predictions,
-                                verbose=0, n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
-        end = timer()
-        exec_time = end - start
+        feed_params, scores, exec_time = self._evaluate(params, estimator,
+                                                        x, y, **fit_params)
 
         self._report.update(feed_params, scores, exec_time)
         score = scores['test_score'].mean()
 
         return score
 
+    def _evaluate(self, params, estimator, x, y, n_jobs=None, **fit_params):
+        feed_params = self._get_feed_params(params)
+        # No per-trial clone: every trial overwrites the same searched keys
+        # on the baseline clone made in fit, and cross_validate clones per
+        # fold anyway
+        estimator.set_params(**feed_params)
+
+        start = timer()
+        scores = cross_validate(estimator, x, y, scoring=self.scoring, cv=self._cached_splits,
+                                fit_params=fit_params, return_predictions=self.return_predictions,
+                                verbose=0, n_jobs=self._inner_n_jobs if n_jobs is None else n_jobs,
+                                pre_dispatch=self.pre_dispatch)
+        end = timer()
+
+        return feed_params, scores, end - start
+
     def _get_results(self, x, y, **fit_params):
         self.cv_results_ = self._report.report()
         self.best_params_ = self._report.best_params_
@@ -385,14 +489,16 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
 
         self._results = results
 
-    def _get_feed_params(self, bounds, next_set):
+    def _get_feed_params(self, next_set):
         params = {}
-        for i in range(len(bounds)):
-            param_name = bounds[i]['name']
-            picked_value = next_set[0, i]
-            if param_name in self._str_params:
-                picked_value = self._str_params[param_name][self._check_int(picked_value)]
-            params[param_name] = self._check_int(picked_value)
+        for value, name, categories, is_int in zip(next_set[0], self._names,
+                                                   self._cat_tables, self._int_flags):
+            if categories is not None:
+                params[name] = self._check_int(categories[int(value)])
+            elif is_int:
+                params[name] = int(value)
+            else:
+                params[name] = float(value)
         return params
 
     @staticmethod
@@ -444,8 +550,9 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
                 raise TypeError('Bound definition is not complete')
 
         def distr_to_discrete(distr):
-            discrete_range = distr.rvs(n_samples).tolist()
-            return discrete_range
+            # Keep the samples as an ndarray; GPyOpt accepts array domains
+            # and .tolist() would box every element into a Python float
+            return distr.rvs(n_samples)
 
         def check_str(bound):
             if isinstance(bound['domain'], list):
@@ -468,6 +575,15 @@ class BayesianSearchCV(BayesianOptimization, BaseEstimator):
         else:
             raise TypeError('Invalid grid type')
 
+    @staticmethod
+    def _is_int_domain(domain):
+        values = np.asarray(domain)
+        if values.dtype.kind in 'iu':
+            return True
+        if values.dtype.kind == 'f':
+            return bool((values == np.floor(values)).all())
+        return False
+
     @staticmethod
     def _check_int(n):
         if isinstance(n, float):